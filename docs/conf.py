@@ -48,9 +48,23 @@ extensions = [
     "sphinx_rtd_theme",
 ]
 
+# Optional build accelerator: drop autosummary-generated pages from the
+# toctree rendering when the extension is available. Not a hard dependency,
+# so the build still works without it.
+try:
+    import sphinx_remove_toctrees  # noqa: F401
+
+    extensions.append("sphinx_remove_toctrees")
+    remove_from_toctrees = ["api/generated/*"]
+except ImportError:
+    pass
+
 napoleon_google_docstring = True
 napoleon_numpy_docstring = False
 
+suppress_warnings = ["autosectionlabel.*"]
+nitpicky = False
+
 templates_path = ["_templates"]
 exclude_patterns = [
     "_build",
@@ -0,0 +1,54 @@
+"""Regenerate the perfect-hash table backing fbcm.constants.position_group.
+
+Searches small multipliers and table sizes for an index function
+
+    idx(s) = (ord(s[0]) * M1 + ord(s[-1]) * M2 + len(s)) % N
+
+that is collision-free over every key in POSITION_TO_GROUP_MAP, then prints
+the constants and table ready to paste into src/fbcm/constants.py. Run this
+whenever a new position abbreviation is added to the map.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fbcm.constants import POSITION_TO_GROUP_MAP
+
+
+def find_hash_params(keys):
+    for table_size in range(len(keys), 256):
+        for m1 in range(1, 128):
+            for m2 in range(1, 64):
+                indices = {
+                    (ord(key[0]) * m1 + ord(key[-1]) * m2 + len(key)) % table_size
+                    for key in keys
+                }
+                if len(indices) == len(keys):
+                    return m1, m2, table_size
+    raise RuntimeError("No collision-free parameters found; widen the search.")
+
+
+def main():
+    keys = list(POSITION_TO_GROUP_MAP)
+    m1, m2, table_size = find_hash_params(keys)
+
+    table = [None] * table_size
+    for key, group in POSITION_TO_GROUP_MAP.items():
+        table[(ord(key[0]) * m1 + ord(key[-1]) * m2 + len(key)) % table_size] = (
+            key,
+            group,
+        )
+
+    print(f"_PG_M1 = {m1}")
+    print(f"_PG_M2 = {m2}")
+    print(f"_PG_N = {table_size}")
+    print("_PG_TABLE = (")
+    for entry in table:
+        print(f"    {entry!r},")
+    print(")")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ import ffmpeg
 from mutagen.mp4 import MP4
 from yt_dlp import YoutubeDL
 
-from .constants import ABBREVIATION_MAP, CONCURRENT_FRAGMENTS, THROTTLED_RATE_LIMIT
+from .constants import ABBREVIATION_MAP, concurrent_fragments, throttled_rate_limit
 
 
 def convert_nfl_playoff_name_to_int(year: int, week_name: str) -> int:
@@ -293,9 +293,9 @@ class BaseDownloader:
         self.base_yt_opts = {
             "format": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]",
             "merge_output_format": "mp4",
-            "concurrent_fragment_downloads": CONCURRENT_FRAGMENTS,
+            "concurrent_fragment_downloads": concurrent_fragments(),
             "addmetadata": True,
-            "throttledratelimit": THROTTLED_RATE_LIMIT,
+            "throttledratelimit": throttled_rate_limit(),
             "embedsubs": True,
             "writesubs": True,
             "subtitleslangs": ["en"],
@@ -1,187 +1,199 @@
+import functools
 import os
+import sys
+from collections import namedtuple
+from enum import StrEnum
+from types import MappingProxyType
+
+
+def _freeze(mapping):
+    """Return a read-only view of *mapping* with interned string keys."""
+    return MappingProxyType({sys.intern(key): value for key, value in mapping.items()})
+
 
 # Application related
-OUTPUT_FORMATS = {
-    "json": "JSON",
-    "yaml": "YAML",
-    "csv": "CSV",
-    "docx": "Microsoft Word",
+class OutputFormat(StrEnum):
+    JSON = "json"
+    YAML = "yaml"
+    CSV = "csv"
+    DOCX = "docx"
+
+    @property
+    def display(self) -> str:
+        return _OUTPUT_FORMAT_DISPLAY[self]
+
+
+_OUTPUT_FORMAT_DISPLAY = {
+    OutputFormat.JSON: "JSON",
+    OutputFormat.YAML: "YAML",
+    OutputFormat.CSV: "CSV",
+    OutputFormat.DOCX: "Microsoft Word",
 }
-MEDIA_BASE_DIR = os.getenv("MEDIA_BASE_DIR")
-CONCURRENT_FRAGMENTS = os.getenv("CONCURRENT_FRAGMENTS", 1)
-THROTTLED_RATE_LIMIT = os.getenv("THROTTLED_RATE_LIMIT", 1000000)
+
+OUTPUT_FORMATS = _freeze({member.value: member.display for member in OutputFormat})
+# Environment-derived settings are exposed as cached getters rather than
+# module-level constants, so importing this module never touches the
+# environment and numeric values come back as ints instead of raw strings.
+
+
+@functools.lru_cache(maxsize=1)
+def media_base_dir() -> str | None:
+    return os.environ.get("MEDIA_BASE_DIR")
+
+
+@functools.lru_cache(maxsize=1)
+def concurrent_fragments() -> int:
+    return int(os.environ.get("CONCURRENT_FRAGMENTS", "1"))
+
+
+@functools.lru_cache(maxsize=1)
+def throttled_rate_limit() -> int:
+    return int(os.environ.get("THROTTLED_RATE_LIMIT", "1000000"))
+
+
+@functools.lru_cache(maxsize=1)
+def page_cache_enabled() -> bool:
+    return os.environ.get("FBDL_CACHE") == "1"
+
+
+@functools.lru_cache(maxsize=1)
+def headful_browser() -> bool:
+    return os.environ.get("FBDL_HEADFUL") == "1"
+
+
 # TODO: Think harder about this name?
-PHOTO_BASE_DIR = os.getenv("PHOTO_BASE_DIR", "/mnt/e/FootballGames/automation/output_data/player_photos")
+@functools.lru_cache(maxsize=1)
+def photo_base_dir() -> str:
+    return os.environ.get(
+        "PHOTO_BASE_DIR", "/mnt/e/FootballGames/automation/output_data/player_photos"
+    )
 
 # Franchise/Team information
-ABBREVIATION_MAP = {
-    "PIT": "Pittsburgh",
-    "CLE": "Cleveland",
-    "CIN": "Cincinnati",
-    "BAL": "Baltimore",
-    "IND": "Indianapolis",
-    "HOU": "Houston",
-    "JAX": "Jacksonville",
-    "TEN": "Tennessee",
-    "NWE": "New England",
-    "NYJ": "New York (A)",
-    "MIA": "Miami",
-    "BUF": "Buffalo",
-    "KAN": "Kansas City",
-    "KC": "Kansas City",
-    "OAK": "Oakland",
-    "LV": "Las Vegas",
-    "LVR": "Las Vegas",
-    "DEN": "Denver",
-    "SD": "San Diego",
-    "SDG": "San Diego",
-    "LAC": "Los Angeles (A)",
-    "GNB": "Green Bay",
-    "GB": "Green Bay",
-    "MIN": "Minnesota",
-    "DET": "Detroit",
-    "CHI": "Chicago",
-    "TAM": "Tampa Bay",
-    "TB": "Tampa Bay",
-    "CAR": "Carolina",
-    "ATL": "Atlanta",
-    "NO": "New Orleans",
-    "NOR": "New Orleans",
-    "NYG": "New York (N)",
-    "WAS": "Washington",
-    "DAL": "Dallas",
-    "PHI": "Philadelphia",
-    "ARI": "Arizona",
-    "ARZ": "Arizona",
-    "LAR": "Los Angeles (N)",
-    "STL": "St. Louis",
-    "SEA": "Seattle",
-    "SF": "San Francisco",
-    "SFO": "San Francisco",
-    "RAM": "Los Angeles (N)",
-    "RAI": "Los Angeles Raiders",
-    "PHO": "Phoenix",
+#
+# TEAMS is the single source of truth for franchise records: the canonical
+# (preferred) abbreviation, the short city name used in file stems, the
+# current full name where one exists, and every accepted alias. The flat
+# lookup maps below are derived from it once at import.
+Team = namedtuple("Team", ["canonical", "city", "full_name", "aliases"])
+
+TEAMS = (
+    Team("PIT", "Pittsburgh", "Pittsburgh Steelers", ("PIT",)),
+    Team("CLE", "Cleveland", "Cleveland Browns", ("CLE",)),
+    Team("CIN", "Cincinnati", "Cincinnati Bengals", ("CIN",)),
+    Team("BAL", "Baltimore", "Baltimore Ravens", ("BAL",)),
+    Team("IND", "Indianapolis", "Indianapolis Colts", ("IND",)),
+    Team("HOU", "Houston", "Houston Texans", ("HOU",)),
+    Team("JAX", "Jacksonville", "Jacksonville Jaguars", ("JAX",)),
+    Team("TEN", "Tennessee", "Tennessee Titans", ("TEN",)),
+    Team("NWE", "New England", "New England Patriots", ("NWE",)),
+    Team("NYJ", "New York (A)", "New York Jets", ("NYJ",)),
+    Team("MIA", "Miami", "Miami Dolphins", ("MIA",)),
+    Team("BUF", "Buffalo", "Buffalo Bills", ("BUF",)),
+    Team("KC", "Kansas City", "Kansas City Chiefs", ("KAN", "KC")),
+    Team("OAK", "Oakland", None, ("OAK",)),
+    Team("LVR", "Las Vegas", "Las Vegas Raiders", ("LV", "LVR")),
+    Team("DEN", "Denver", "Denver Broncos", ("DEN",)),
+    Team("SDG", "San Diego", None, ("SD", "SDG")),
+    Team("LAC", "Los Angeles (A)", "Los Angeles Chargers", ("LAC",)),
+    Team("GB", "Green Bay", "Green Bay Packers", ("GNB", "GB")),
+    Team("MIN", "Minnesota", "Minnesota Vikings", ("MIN",)),
+    Team("DET", "Detroit", "Detroit Lions", ("DET",)),
+    Team("CHI", "Chicago", "Chicago Bears", ("CHI",)),
+    Team("TB", "Tampa Bay", "Tampa Bay Buccaneers", ("TAM", "TB")),
+    Team("CAR", "Carolina", "Carolina Panthers", ("CAR",)),
+    Team("ATL", "Atlanta", "Atlanta Falcons", ("ATL",)),
+    Team("NOR", "New Orleans", "New Orleans Saints", ("NO", "NOR")),
+    Team("NYG", "New York (N)", "New York Giants", ("NYG",)),
+    Team("WAS", "Washington", "Washington Commanders", ("WAS",)),
+    Team("DAL", "Dallas", "Dallas Cowboys", ("DAL",)),
+    Team("PHI", "Philadelphia", "Philadelphia Eagles", ("PHI",)),
+    Team("ARZ", "Arizona", "Arizona Cardinals", ("ARI", "ARZ")),
+    Team("LAR", "Los Angeles (N)", "Los Angeles Rams", ("LAR", "RAM")),
+    Team("STL", "St. Louis", None, ("STL",)),
+    Team("SEA", "Seattle", "Seattle Seahawks", ("SEA",)),
+    Team("SFO", "San Francisco", "San Francisco 49ers", ("SF", "SFO")),
+    Team("RAI", "Los Angeles Raiders", None, ("RAI",)),
+    Team("PHO", "Phoenix", None, ("PHO",)),
     # CFL
-    "MON": "Montreal",
-    "MTL": "Montreal",
-    "HAM": "Hamilton",
-    "CGY": "Calgary",
-    "TOR": "Toronto",
-    "SSK": "Saskatchewan",
-    "BC": "British Columbia",
-    "OTT": "Ottawa",
-    "WPG": "Winnipeg",
-    "EDM": "Edmonton",
+    Team("MTL", "Montreal", None, ("MON", "MTL")),
+    Team("HAM", "Hamilton", None, ("HAM",)),
+    Team("CGY", "Calgary", None, ("CGY",)),
+    Team("TOR", "Toronto", None, ("TOR",)),
+    Team("SSK", "Saskatchewan", None, ("SSK",)),
+    Team("BC", "British Columbia", None, ("BC",)),
+    Team("OTT", "Ottawa", None, ("OTT",)),
+    Team("WPG", "Winnipeg", None, ("WPG",)),
+    Team("EDM", "Edmonton", None, ("EDM",)),
     # UFL
-    "DC": "Washington DC",
-    "ARL": "Arlington",
-    "SA": "San Antonio",
-    "BHM": "Birmingham",
-    "BHAM": "Birminghame",
-    "MICH": "Michigan",
-    "MEM": "Memphis",
-}
+    Team("DC", "Washington DC", None, ("DC",)),
+    Team("ARL", "Arlington", None, ("ARL",)),
+    Team("SA", "San Antonio", None, ("SA",)),
+    Team("BHM", "Birmingham", None, ("BHM",)),
+    Team("BHAM", "Birminghame", None, ("BHAM",)),
+    Team("MICH", "Michigan", None, ("MICH",)),
+    Team("MEM", "Memphis", None, ("MEM",)),
+)
+
+ABBREVIATION_MAP = _freeze(
+    {alias: team.city for team in TEAMS for alias in team.aliases}
+)
+
+CITY_TO_ABBR = _freeze({team.city: team.canonical for team in TEAMS})
 
-CITY_TO_ABBR = {city: abbr for abbr, city in ABBREVIATION_MAP.items()}
-CITY_TO_ABBR["Los Angeles (A)"] = "LAC"
-CITY_TO_ABBR["Los Angeles (N)"] = "LAR"
-CITY_TO_ABBR["New York (A)"] = "NYJ"
-CITY_TO_ABBR["New York (N)"] = "NYG"
-
-
-TEAM_FULL_NAMES = {
-    "NYJ": "New York Jets",
-    "NWE": "New England Patriots",
-    "MIA": "Miami Dolphins",
-    "BUF": "Buffalo Bills",
-    "PIT": "Pittsburgh Steelers",
-    "CLE": "Cleveland Browns",
-    "BAL": "Baltimore Ravens",
-    "CIN": "Cincinnati Bengals",
-    "JAX": "Jacksonville Jaguars",
-    "IND": "Indianapolis Colts",
-    "HOU": "Houston Texans",
-    "TEN": "Tennessee Titans",
-    "LAC": "Los Angeles Chargers",
-    "KC": "Kansas City Chiefs",
-    "KAN": "Kansas City Chiefs",
-    "LVR": "Las Vegas Raiders",
-    "DEN": "Denver Broncos",
-    "DAL": "Dallas Cowboys",
-    "NYG": "New York Giants",
-    "PHI": "Philadelphia Eagles",
-    "WAS": "Washington Commanders",
-    "GB": "Green Bay Packers",
-    "GNB": "Green Bay Packers",
-    "CHI": "Chicago Bears",
-    "MIN": "Minnesota Vikings",
-    "DET": "Detroit Lions",
-    "TB": "Tampa Bay Buccaneers",
-    "TAM": "Tampa Bay Buccaneers",
-    "CAR": "Carolina Panthers",
-    "ATL": "Atlanta Falcons",
-    "NO": "New Orleans Saints",
-    "NOR": "New Orleans Saints",
-    "ARI": "Arizona Cardinals",
-    "ARZ": "Arizona Cardinals",
-    "SEA": "Seattle Seahawks",
-    "SF": "San Francisco 49ers",
-    "SFO": "San Francisco 49ers",
-    "LAR": "Los Angeles Rams",
-    "RAM": "Los Angeles Rams",
-}
+
+# Aliases that resolve for city/abbreviation lookups but deliberately do
+# not map to a full name: the historical full-name map never accepted
+# "LV", and widening it would change which feed abbreviations resolve.
+_FULL_NAME_ALIAS_EXCLUSIONS = frozenset({"LV"})
+
+TEAM_FULL_NAMES = _freeze({
+    alias: team.full_name
+    for team in TEAMS
+    for alias in team.aliases
+    if team.full_name is not None and alias not in _FULL_NAME_ALIAS_EXCLUSIONS
+})
 
 
 # Positional/statistical related information
-POSITIONS = ["QB", "RB", "WR", "TE", "OL", "DL", "EDGE", "LB", "DB"]
-
-
-POSITION_STATS = {
-    "QB": {
-        "Passing": [
-            "CMP",
-            "ATT",
-            "CMP%",
-            "YDS",
-            "TD",
-            "INT",
-            "SACK",
-            "RTG"
-        ]
-    },
-    "RB": {
-        "Rushing": ["ATT", "YDS", "AVG", "TD"],
-        "Receiving": ["REC", "YDS", "AVG", "TD"],
-    },
-    "WR": {
-        "Receiving": ["REC", "YDS", "AVG", "TD"],
-        "Rushing": ["ATT", "YDS", "AVG", "TD"],
-    },
-    "TE": {
-        "Receiving": ["REC", "YDS", "AVG", "TD"],
-        "Rushing": ["ATT", "YDS", "AVG", "TD"],
-    },
-    "OL": {},
-    "DL": {
-        "Tackles": ["TOTAL", "SOLO", "FF", "SACKS"],
-        "Interceptions": ["INTS", "YDS", "TDS", "PDS"],
-    },
-    "EDGE": {
-        "Tackles": ["TOTAL", "SOLO", "FF", "SACKS"],
-        "Interceptions": ["INTS", "YDS", "TDS", "PDS"],
-    },
-    "LB": {
-        "Tackles": ["TOTAL", "SOLO", "FF", "SACKS"],
-        "Interceptions": ["INTS", "YDS", "TDS", "PDS"],
-    },
-    "DB": {
-        "Tackles": ["TOTAL", "SOLO", "FF", "SACKS"],
-        "Interceptions": ["INTS", "YDS", "TDS", "PDS"],
-    },
-}
+POSITIONS = ("QB", "RB", "WR", "TE", "OL", "DL", "EDGE", "LB", "DB")
+
+
+# Shared stat sub-tables. The skill-position and defensive groupings are
+# identical across positions (only the category order differs for RB vs
+# WR/TE), so each variant is built once and referenced from every owning key.
+_RUSHING_STATS = ("ATT", "YDS", "AVG", "TD")
+_RECEIVING_STATS = ("REC", "YDS", "AVG", "TD")
+
+_PASSING_STATS = _freeze({
+    "Passing": ("CMP", "ATT", "CMP%", "YDS", "TD", "INT", "SACK", "RTG"),
+})
+_RB_STATS = _freeze({
+    "Rushing": _RUSHING_STATS,
+    "Receiving": _RECEIVING_STATS,
+})
+_PASS_CATCHER_STATS = _freeze({
+    "Receiving": _RECEIVING_STATS,
+    "Rushing": _RUSHING_STATS,
+})
+_DEF_STATS = _freeze({
+    "Tackles": ("TOTAL", "SOLO", "FF", "SACKS"),
+    "Interceptions": ("INTS", "YDS", "TDS", "PDS"),
+})
 
+POSITION_STATS = _freeze({
+    "QB": _PASSING_STATS,
+    "RB": _RB_STATS,
+    "WR": _PASS_CATCHER_STATS,
+    "TE": _PASS_CATCHER_STATS,
+    "OL": _freeze({}),
+    "DL": _DEF_STATS,
+    "EDGE": _DEF_STATS,
+    "LB": _DEF_STATS,
+    "DB": _DEF_STATS,
+})
 
-POSITION_TO_GROUP_MAP = {
+
+POSITION_TO_GROUP_MAP = _freeze({
     "QB": "QB",
     "HB": "RB",
     "FB": "RB",
@@ -215,13 +227,142 @@ POSITION_TO_GROUP_MAP = {
     "S": "DB",
     "FS": "DB",
     "SS": "DB",
-}
+})
+
+# Perfect-hash dispatch for position -> group lookups. The constants and
+# table are generated by scripts/gen_position_hash.py from
+# POSITION_TO_GROUP_MAP; the index function is collision-free for every key
+# in the map, so a lookup is a single arithmetic index plus one key compare.
+_PG_M1 = 44
+_PG_M2 = 5
+_PG_N = 62
+_PG_TABLE = (
+    ('RT', 'OL'),
+    ('MLB', 'LB'),
+    ('FB', 'RB'),
+    None,
+    ('DT', 'DL'),
+    None,
+    None,
+    ('NG', 'DL'),
+    None,
+    None,
+    ('NT', 'DL'),
+    ('ILB', 'LB'),
+    None,
+    ('TE', 'TE'),
+    None,
+    None,
+    None,
+    None,
+    ('LB', 'LB'),
+    ('LCB', 'CB'),
+    ('LOLB', 'LB'),
+    None,
+    None,
+    None,
+    ('WR', 'WR'),
+    ('FS', 'DB'),
+    ('DL', 'DL'),
+    ('OLB', 'LB'),
+    ('HB', 'RB'),
+    None,
+    None,
+    None,
+    None,
+    ('LE', 'EDGE'),
+    ('RB', 'RB'),
+    ('RCB', 'CB'),
+    ('ROLB', 'LB'),
+    ('EDGE', 'EDGE'),
+    ('S', 'DB'),
+    ('SS', 'DB'),
+    None,
+    None,
+    None,
+    ('LG', 'OL'),
+    None,
+    None,
+    ('LT', 'OL'),
+    None,
+    None,
+    ('RE', 'EDGE'),
+    None,
+    ('OG', 'OL'),
+    ('QB', 'QB'),
+    ('DE', 'EDGE'),
+    ('OT', 'OL'),
+    None,
+    ('CB', 'DB'),
+    None,
+    None,
+    ('RG', 'OL'),
+    ('C', 'OL'),
+    None,
+)
+
+
+def _exact_position_group(position: str) -> str | None:
+    """Exact perfect-hash probe; None when *position* is not a known key."""
+    entry = _PG_TABLE[
+        (ord(position[0]) * _PG_M1 + ord(position[-1]) * _PG_M2 + len(position))
+        % _PG_N
+    ]
+    if entry is not None and entry[0] == position:
+        return entry[1]
+    return None
+
+
+def position_group(position: str) -> str | None:
+    """
+    Map a position abbreviation to its group.
+
+    Exact matches resolve through the perfect-hash table. Strings carrying
+    feed suffixes ("LOLB1", "RCB-2") fall back to the longest known prefix,
+    so depth-chart or play-by-play variants still resolve. Every key in the
+    map is at most four characters, so the prefix walk is bounded.
+
+    :param position: A position abbreviation, e.g. "LOLB" or "LOLB1".
+    :return: The position group, or None if no known prefix matches.
+    """
+    if not position:
+        return None
+
+    group = _exact_position_group(position)
+    if group is not None:
+        return group
+
+    for length in range(min(len(position) - 1, 4), 0, -1):
+        group = _exact_position_group(position[:length])
+        if group is not None:
+            return group
+    return None
+
+
+if __debug__:
+    assert all(
+        position_group(key) == group for key, group in POSITION_TO_GROUP_MAP.items()
+    )
 
 
 # NFL.com specific
-DEFAULT_REPLAY_TYPES = {
-    "full_game": "Full Game",
-    "all_22": "All-22",
-    "condensed_game": "Condensed Game",
-    "full_game_alternative": "Full Game - Alternative Broadcasts",
+class ReplayType(StrEnum):
+    FULL_GAME = "full_game"
+    ALL_22 = "all_22"
+    CONDENSED_GAME = "condensed_game"
+    FULL_GAME_ALTERNATIVE = "full_game_alternative"
+
+    @property
+    def display(self) -> str:
+        return _REPLAY_TYPE_DISPLAY[self]
+
+
+# The display strings are the replay type names the NFL API expects.
+_REPLAY_TYPE_DISPLAY = {
+    ReplayType.FULL_GAME: "Full Game",
+    ReplayType.ALL_22: "All-22",
+    ReplayType.CONDENSED_GAME: "Condensed Game",
+    ReplayType.FULL_GAME_ALTERNATIVE: "Full Game - Alternative Broadcasts",
 }
+
+DEFAULT_REPLAY_TYPES = _freeze({member.value: member.display for member in ReplayType})
@@ -1,8 +1,12 @@
+import copy
 import json
 import math
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -18,6 +22,26 @@ from ..constants import POSITION_STATS
 from ..models import ColorScheme, ProspectDataSoup
 
 
+# Compiled once: filename sanitizing runs per generated document.
+_SAFE_NAME_RE = re.compile(r"[^\w-]")
+
+# Shared Length singletons for the per-cell loops below; Pt() allocates a
+# fresh object every call and these sizes recur for every ranking/stat cell.
+_PT_0 = Pt(0)
+_PT_1 = Pt(1)
+_PT_6 = Pt(6)
+_PT_7 = Pt(7)
+_PT_9 = Pt(9)
+_PT_11 = Pt(11)
+_PT_14 = Pt(14)
+_PT_18 = Pt(18)
+
+
+def safe_filename(name: str) -> str:
+    """Reduce a prospect name to a filesystem-safe stem."""
+    return _SAFE_NAME_RE.sub("", name.replace(" ", "_"))
+
+
 def get_primary_position(position: str) -> str:
     """Extract the primary position from multi-position strings like 'DL/EDGE'."""
     if not position:
@@ -174,19 +198,67 @@ def create_rating_ring(
 # ─── DOCX HELPERS ────────────────────────────────────────────────────────────
 
 
+# Prototype caches: reports reuse the same two or three shade colors and
+# margin sets across dozens of cells, so build each <w:shd>/<w:tcMar>
+# subtree once and deepcopy it instead of re-creating elements (and
+# re-resolving qualified names) per cell.
+_SHD_TAG = qn("w:shd")
+_SHADING_CACHE: Dict[str, Any] = {}
+_MARGIN_CACHE: Dict[tuple, Any] = {}
+_NO_BORDERS_PROTO = None
+
+
+def _shading_element(hex_color: str):
+    hex_color = hex_color.lstrip("#").upper()
+    proto = _SHADING_CACHE.get(hex_color)
+    if proto is None:
+        proto = OxmlElement("w:shd")
+        proto.set(qn("w:val"), "clear")
+        proto.set(qn("w:color"), "auto")
+        proto.set(qn("w:fill"), hex_color)
+        _SHADING_CACHE[hex_color] = proto
+    return copy.deepcopy(proto)
+
+
+def _margins_element(margins: tuple):
+    proto = _MARGIN_CACHE.get(margins)
+    if proto is None:
+        top, bottom, left, right = margins
+        proto = OxmlElement("w:tcMar")
+        for margin_name, margin_value in (
+            ("top", top),
+            ("bottom", bottom),
+            ("left", left),
+            ("right", right),
+        ):
+            margin = OxmlElement(f"w:{margin_name}")
+            margin.set(qn("w:w"), str(margin_value))
+            margin.set(qn("w:type"), "dxa")
+            proto.append(margin)
+        _MARGIN_CACHE[margins] = proto
+    return copy.deepcopy(proto)
+
+
+def _no_borders_element():
+    global _NO_BORDERS_PROTO
+    if _NO_BORDERS_PROTO is None:
+        proto = OxmlElement("w:tcBorders")
+        for border_name in ("top", "left", "bottom", "right"):
+            border = OxmlElement(f"w:{border_name}")
+            border.set(qn("w:val"), "nil")
+            proto.append(border)
+        _NO_BORDERS_PROTO = proto
+    return copy.deepcopy(_NO_BORDERS_PROTO)
+
+
 def set_cell_shading(cell, hex_color: str):
     """Set cell background color."""
-    hex_color = hex_color.lstrip("#").upper()
     tc = cell._tc
     tcPr = tc.get_or_add_tcPr()
     # Remove existing shading
-    for shd in tcPr.findall(qn("w:shd")):
+    for shd in tcPr.findall(_SHD_TAG):
         tcPr.remove(shd)
-    shading = OxmlElement("w:shd")
-    shading.set(qn("w:val"), "clear")
-    shading.set(qn("w:color"), "auto")
-    shading.set(qn("w:fill"), hex_color)
-    tcPr.append(shading)
+    tcPr.append(_shading_element(hex_color))
 
 
 def set_cell_margins(cell, top=0, bottom=0, left=0, right=0):
@@ -248,6 +320,122 @@ def add_left_border(cell, hex_color: str, size: int = 24):
     tcPr.append(tcBorders)
 
 
+_TCPR_REPLACED_TAGS = (qn("w:shd"), qn("w:tcMar"), qn("w:tcBorders"))
+
+
+def format_cell(cell, fill: str = None, margins: tuple = None):
+    """
+    Apply border removal, shading, and margins in one tcPr construction.
+
+    Collapses the remove_cell_borders/set_cell_shading/set_cell_margins
+    triple the generator runs on nearly every table cell. Each of those
+    helpers re-fetches tcPr and rescans its children; building the whole
+    subtree once does the same work in a single pass.
+
+    Args:
+        cell: Table cell to format. Borders are always removed.
+        fill: Optional background hex color.
+        margins: Optional (top, bottom, left, right) margins in twips.
+    """
+    tcPr = cell._tc.get_or_add_tcPr()
+    for child in list(tcPr):
+        if child.tag in _TCPR_REPLACED_TAGS:
+            tcPr.remove(child)
+
+    tcPr.append(_no_borders_element())
+
+    if fill is not None:
+        tcPr.append(_shading_element(fill))
+
+    if margins is not None:
+        tcPr.append(_margins_element(margins))
+
+
+def paragraph_xml(
+    runs,
+    space_before: int = None,
+    space_after: int = None,
+    indent_left: int = None,
+    justify: bool = False,
+):
+    """
+    Build a formatted paragraph as a raw <w:p> element.
+
+    Repeated sections (skill bars, comparisons, scouting bullets) emit
+    many small paragraphs per prospect; going through add_paragraph/
+    add_run pays python-docx's style and attribute machinery for every
+    run. Constructing the element tree directly lets callers extend a
+    cell or the body with a whole section in one go.
+
+    Args:
+        runs: Iterable of (text, props) pairs. Recognized props:
+            "bold" (bool), "color" (hex string), "size" (points),
+            "font" (typeface name).
+        space_before: Paragraph spacing before, in twips.
+        space_after: Paragraph spacing after, in twips.
+        indent_left: Left indent, in twips.
+        justify: Whether to justify the paragraph.
+    """
+    p = OxmlElement("w:p")
+    pPr = OxmlElement("w:pPr")
+    if space_before is not None or space_after is not None:
+        spacing = OxmlElement("w:spacing")
+        if space_before is not None:
+            spacing.set(qn("w:before"), str(space_before))
+        if space_after is not None:
+            spacing.set(qn("w:after"), str(space_after))
+        pPr.append(spacing)
+    if indent_left is not None:
+        ind = OxmlElement("w:ind")
+        ind.set(qn("w:left"), str(indent_left))
+        pPr.append(ind)
+    if justify:
+        jc = OxmlElement("w:jc")
+        jc.set(qn("w:val"), "both")
+        pPr.append(jc)
+    p.append(pPr)
+
+    for run_text, props in runs:
+        r = OxmlElement("w:r")
+        rPr = OxmlElement("w:rPr")
+        if props.get("font"):
+            rFonts = OxmlElement("w:rFonts")
+            rFonts.set(qn("w:ascii"), props["font"])
+            rFonts.set(qn("w:hAnsi"), props["font"])
+            rPr.append(rFonts)
+        if props.get("bold"):
+            rPr.append(OxmlElement("w:b"))
+        if props.get("color"):
+            color = OxmlElement("w:color")
+            color.set(qn("w:val"), props["color"].lstrip("#").upper())
+            rPr.append(color)
+        if props.get("size"):
+            sz = OxmlElement("w:sz")
+            sz.set(qn("w:val"), str(int(props["size"] * 2)))  # half-points
+            rPr.append(sz)
+        r.append(rPr)
+        t = OxmlElement("w:t")
+        t.set(qn("xml:space"), "preserve")
+        t.text = run_text
+        r.append(t)
+        p.append(r)
+
+    return p
+
+
+def bullet_paragraph_xml(marker: str, marker_hex: str, text: str):
+    """Build one scouting-report bullet as a raw <w:p> element."""
+    return paragraph_xml(
+        [
+            (marker, {"bold": True, "color": marker_hex, "size": 11}),
+            (text, {"color": "444444", "size": 11}),
+        ],
+        space_after=80,  # Pt(4)
+        indent_left=216,  # Inches(0.15)
+        justify=True,
+    )
+
+
 def skill_bar(pct: int) -> str:
     """Generate ASCII skill bar."""
     filled = round(pct / 10)
@@ -467,25 +655,23 @@ class WordDocGenerator:
         for i, (source, value, label, bg_color) in enumerate(rankings_data):
             cell = rankings_table.cell(0, i)
             cell.width = Inches(1.35)
-            remove_cell_borders(cell)
-            set_cell_shading(cell, bg_color)
-            set_cell_margins(cell, top=100, bottom=80, left=80, right=80)
+            format_cell(cell, fill=bg_color, margins=(100, 80, 80, 80))
             cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
 
             # Source label
             p1 = cell.paragraphs[0]
             p1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p1.paragraph_format.space_after = Pt(1)
+            p1.paragraph_format.space_after = _PT_1
             run = p1.add_run(source)
-            run.font.size = Pt(6)
+            run.font.size = _PT_6
             run.font.color.rgb = self.colors.light_rgb
 
             # Value
             p2 = cell.add_paragraph()
             p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p2.paragraph_format.space_before = Pt(0)
-            p2.paragraph_format.space_after = Pt(1)
-            font_size = Pt(11) if label == "PROJECTION" else Pt(18)
+            p2.paragraph_format.space_before = _PT_0
+            p2.paragraph_format.space_after = _PT_1
+            font_size = _PT_11 if label == "PROJECTION" else _PT_18
             run = p2.add_run(value)
             run.font.size = font_size
             run.font.bold = True
@@ -494,8 +680,8 @@ class WordDocGenerator:
             # Category label
             p3 = cell.add_paragraph()
             p3.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            p3.paragraph_format.space_before = Pt(0)
-            p3.paragraph_format.space_after = Pt(0)
+            p3.paragraph_format.space_before = _PT_0
+            p3.paragraph_format.space_after = _PT_0
             run = p3.add_run(label)
             run.font.size = Pt(6.5)
             run.font.color.rgb = self.colors.light_rgb
@@ -567,42 +753,40 @@ class WordDocGenerator:
                         start_cell.merge(end_cell)
 
                     header_cell = stats_table.cell(0, col_idx)
-                    remove_cell_borders(header_cell)
-                    set_cell_shading(header_cell, bg_color)
-                    set_cell_margins(header_cell, top=80, bottom=40, left=40, right=40)
+                    format_cell(header_cell, fill=bg_color, margins=(80, 40, 40, 40))
                     header_cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
 
                     p = header_cell.paragraphs[0]
                     p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    p.paragraph_format.space_after = Pt(0)
+                    p.paragraph_format.space_after = _PT_0
                     run = p.add_run(category.upper())
-                    run.font.size = Pt(9)
+                    run.font.size = _PT_9
                     run.font.bold = True
                     run.font.color.rgb = label_rgb
 
                     for j, stat_label in enumerate(stat_labels):
                         stat_cell = stats_table.cell(1, col_idx + j)
                         stat_cell.width = Inches(6.75 / total_stats)
-                        remove_cell_borders(stat_cell)
-                        set_cell_shading(stat_cell, bg_color)
-                        set_cell_margins(stat_cell, top=80, bottom=40, left=40, right=40)
+                        format_cell(
+                            stat_cell, fill=bg_color, margins=(80, 40, 40, 40)
+                        )
                         stat_cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
 
                         p1 = stat_cell.paragraphs[0]
                         p1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        p1.paragraph_format.space_after = Pt(1)
+                        p1.paragraph_format.space_after = _PT_1
                         stat_value = self._get_stat_value(category, stat_label)
                         run = p1.add_run(stat_value)
-                        run.font.size = Pt(14)
+                        run.font.size = _PT_14
                         run.font.bold = True
                         run.font.color.rgb = self.colors.primary_rgb
 
                         p2 = stat_cell.add_paragraph()
                         p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        p2.paragraph_format.space_before = Pt(0)
-                        p2.paragraph_format.space_after = Pt(1)
+                        p2.paragraph_format.space_before = _PT_0
+                        p2.paragraph_format.space_after = _PT_1
                         run = p2.add_run(stat_label)
-                        run.font.size = Pt(7)
+                        run.font.size = _PT_7
                         run.font.color.rgb = label_rgb
 
                     col_idx += num_stats
@@ -618,26 +802,26 @@ class WordDocGenerator:
                 for i, stat_label in enumerate(stat_labels):
                     cell = stats_table.cell(0, i)
                     cell.width = Inches(6.75 / len(stat_labels))
-                    remove_cell_borders(cell)
-                    set_cell_shading(cell, self.colors.light)
-                    set_cell_margins(cell, top=100, bottom=40, left=40, right=40)
+                    format_cell(
+                        cell, fill=self.colors.light, margins=(100, 40, 40, 40)
+                    )
                     cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
 
                     p1 = cell.paragraphs[0]
                     p1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    p1.paragraph_format.space_after = Pt(1)
+                    p1.paragraph_format.space_after = _PT_1
                     stat_value = self._get_stat_value(category, stat_label)
                     run = p1.add_run(stat_value)
-                    run.font.size = Pt(14)
+                    run.font.size = _PT_14
                     run.font.bold = True
                     run.font.color.rgb = self.colors.primary_rgb
 
                     p2 = cell.add_paragraph()
                     p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    p2.paragraph_format.space_before = Pt(0)
-                    p2.paragraph_format.space_after = Pt(1)
+                    p2.paragraph_format.space_before = _PT_0
+                    p2.paragraph_format.space_after = _PT_1
                     run = p2.add_run(stat_label)
-                    run.font.size = Pt(7)
+                    run.font.size = _PT_7
                     run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
 
         else:
@@ -667,27 +851,25 @@ class WordDocGenerator:
 
         # TODO: Skills, comparisons, and recruiting should probably all be distinct methods
 
+        mono_gray = {"font": "Consolas", "size": 10, "color": "555555"}
+        mono_primary = {"font": "Consolas", "size": 10, "color": self.colors.primary}
+
+        skill_paragraphs = []
         for skill_name, skill_pct in self.prospect.skills.to_dict().items():
             if skill_pct is None:
                 continue
-            p = skills_cell.add_paragraph()
-            p.paragraph_format.space_after = Pt(2)
-
             display_name = skill_name.replace("rating", "rtg").replace("targeted", "tgt").replace("_", " ").title()
-            run = p.add_run(f"{display_name:<20} ")
-            run.font.name = "Consolas"
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
-
-            run = p.add_run(skill_bar(skill_pct))
-            run.font.name = "Consolas"
-            run.font.size = Pt(10)
-            run.font.color.rgb = self.colors.primary_rgb
-
-            run = p.add_run(f" {skill_pct}%")
-            run.font.name = "Consolas"
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
+            skill_paragraphs.append(
+                paragraph_xml(
+                    [
+                        (f"{display_name:<20} ", mono_gray),
+                        (skill_bar(skill_pct), mono_primary),
+                        (f" {skill_pct}%", mono_gray),
+                    ],
+                    space_after=40,  # Pt(2)
+                )
+            )
+        skills_cell._tc.extend(skill_paragraphs)
 
         comp_cell = skills_table.cell(0, 1)
         comp_cell.width = Inches(3.0)
@@ -703,22 +885,20 @@ class WordDocGenerator:
         if self.prospect.comparisons is None:
             self.prospect.comparisons = []
 
-        for comp in self.prospect.comparisons:
-            p = comp_cell.add_paragraph()
-            p.paragraph_format.space_after = Pt(2)
-
-            run = p.add_run(f"{comp.name} ")
-            run.font.size = Pt(9)
-            run.font.bold = True
-
-            run = p.add_run(f"({comp.school}) ")
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-
-            run = p.add_run(f"{comp.similarity}%")
-            run.font.size = Pt(10)
-            run.font.bold = True
-            run.font.color.rgb = self.colors.primary_rgb
+        comp_cell._tc.extend(
+            paragraph_xml(
+                [
+                    (f"{comp.name} ", {"size": 9, "bold": True}),
+                    (f"({comp.school}) ", {"size": 10, "color": "666666"}),
+                    (
+                        f"{comp.similarity}%",
+                        {"size": 10, "bold": True, "color": self.colors.primary},
+                    ),
+                ],
+                space_after=40,  # Pt(2)
+            )
+            for comp in self.prospect.comparisons
+        )
 
         if self.prospect.ratings:
             p = comp_cell.add_paragraph()
@@ -771,20 +951,10 @@ class WordDocGenerator:
         run.font.bold = True
         run.font.color.rgb = RGBColor(0x1D, 0x6A, 0x4D)
 
-        for strength in self.prospect.scouting_report.strengths:
-            p = str_cell.add_paragraph()
-            p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            p.paragraph_format.space_after = Pt(4)
-            p.paragraph_format.left_indent = Inches(0.15)
-
-            run = p.add_run("+ ")
-            run.font.bold = True
-            run.font.size = Pt(11)
-            run.font.color.rgb = RGBColor(0x1D, 0x6A, 0x4D)
-
-            run = p.add_run(strength)
-            run.font.size = Pt(11)
-            run.font.color.rgb = RGBColor(0x44, 0x44, 0x44)
+        str_cell._tc.extend(
+            bullet_paragraph_xml("+ ", "1D6A4D", strength)
+            for strength in self.prospect.scouting_report.strengths
+        )
 
         weak_cell = sw_table.cell(0, 1)
         weak_cell.width = Inches(3.375)
@@ -797,20 +967,10 @@ class WordDocGenerator:
         run.font.bold = True
         run.font.color.rgb = RGBColor(0xA6, 0x5D, 0x21)
 
-        for weakness in self.prospect.scouting_report.weaknesses:
-            p = weak_cell.add_paragraph()
-            p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            p.paragraph_format.space_after = Pt(4)
-            p.paragraph_format.left_indent = Inches(0.15)
-
-            run = p.add_run("– ")
-            run.font.bold = True
-            run.font.size = Pt(11)
-            run.font.color.rgb = RGBColor(0xA6, 0x5D, 0x21)
-
-            run = p.add_run(weakness)
-            run.font.size = Pt(11)
-            run.font.color.rgb = RGBColor(0x44, 0x44, 0x44)
+        weak_cell._tc.extend(
+            bullet_paragraph_xml("\u2013 ", "A65D21", weakness)
+            for weakness in self.prospect.scouting_report.weaknesses
+        )
 
     def _gen_scouting_summary(self):
         if self.prospect.scouting_report.summary:
@@ -868,9 +1028,62 @@ class WordDocGenerator:
         if filename:
             full_doc_path = f"{self.output_path}/{filename}"
         elif self._prospect_count == 1:
-            full_doc_path = f"{self.output_path}/{self._last_prospect_name}.docx"
+            full_doc_path = (
+                f"{self.output_path}/{safe_filename(self._last_prospect_name)}.docx"
+            )
         else:
             full_doc_path = f"{self.output_path}/prospects.docx"
 
         self.document.save(full_doc_path)
         self._cleanup_ring_images()
+
+
+def _generate_prospect_doc(
+    data: Dict, output_path: str, ring_image_base_dir: str, colors_path: str
+) -> str:
+    """Worker: render one prospect into its own document."""
+    prospect = ProspectDataSoup.from_dict(data=data)
+    generator = WordDocGenerator(
+        output_path=output_path,
+        ring_image_base_dir=ring_image_base_dir,
+        colors_path=colors_path,
+        prospect=prospect,
+    )
+    generator.generate_complete_document()
+    return prospect.basic_info.full_name
+
+
+def generate_documents_parallel(
+    position_data: Dict[str, Dict],
+    output_path: str,
+    ring_image_base_dir: str,
+    colors_path: str,
+    max_workers: int = None,
+) -> List[str]:
+    """
+    Render per-prospect documents across processes.
+
+    Document generation is pure CPU (lxml tree building, PIL ring
+    rendering, zip packing), so independent single-prospect documents
+    scale across cores. The cumulative all-prospects document stays
+    serial — it's one shared docx whose sections must land in order.
+
+    Args:
+        position_data: Mapping of prospect name to serialized prospect
+            dict, as produced by extract-draft-profiles.
+        output_path: Directory the documents are written to.
+        ring_image_base_dir: Scratch directory for rating-ring images.
+        colors_path: Path to the school colors JSON file.
+        max_workers: Process count; defaults to os.cpu_count().
+
+    Returns:
+        The prospect names that were rendered, in input order.
+    """
+    worker = partial(
+        _generate_prospect_doc,
+        output_path=output_path,
+        ring_image_base_dir=ring_image_base_dir,
+        colors_path=colors_path,
+    )
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(worker, position_data.values()))
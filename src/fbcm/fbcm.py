@@ -1,10 +1,10 @@
 import json
+import logging
 import os
 import random
 import time
 from datetime import date, datetime
 from pathlib import Path
-from random import uniform
 from typing import Tuple
 
 import click
@@ -16,12 +16,17 @@ from .base import (
     FileOperationsUtil,
     MetaDataCreator,
 )
-from .constants import DEFAULT_REPLAY_TYPES, OUTPUT_FORMATS, POSITIONS, TEAM_FULL_NAMES
+from .constants import POSITIONS, ReplayType, TEAM_FULL_NAMES, page_cache_enabled
 from .models import ProspectDataSoup
-from .draft_buzz import DraftBuzzScraper, ProspectProfileListExtractor, ProspectParserSoup
+from .draft_buzz import (
+    DraftBuzzScraper,
+    ProspectCache,
+    ProspectProfileListExtractor,
+    ProspectParserSoup,
+)
 from .nfl import NFLShowDownloader, NFLWeeklyDownloader
 from .utils import apply_config_to_kwargs, find_config, load_config
-from .docx.word_gen import WordDocGenerator
+from .docx.word_gen import WordDocGenerator, generate_documents_parallel
 
 
 @click.group()
@@ -33,6 +38,7 @@ from .docx.word_gen import WordDocGenerator
 @click.pass_context
 def cli(ctx, config):
     """fbcm - Football content manager and archiving tools."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     ctx.ensure_object(dict)
     config_path = find_config(config)
     ctx.obj["config"] = load_config(config_path)
@@ -152,7 +158,7 @@ def nfl_show(ctx, input_file, output_directory, cookies_file):
 @click.option(
     "--replay-type",
     multiple=True,
-    type=click.Choice(DEFAULT_REPLAY_TYPES.keys(), case_sensitive=False),
+    type=click.Choice([member.value for member in ReplayType], case_sensitive=False),
     help="Specify which replay types to download. If blank, the full game is downloaded.",
 )
 @click.option("--start-ep", type=int, help="Where to pick up episode numbering from.")
@@ -275,7 +281,7 @@ def nfl_games(
     else:
         teams_to_fetch = [tm for tm in TEAM_FULL_NAMES if tm not in exclude]
 
-    replay_type = [DEFAULT_REPLAY_TYPES[r] for r in replay_type]
+    replay_type = [ReplayType(r).display for r in replay_type]
 
     if list_only:
         games = []
@@ -337,9 +343,15 @@ def extract_draft_profiles(
     with open(input_file, "r") as infile:
         profile_urls = json.load(infile)
 
+    # FBDL_CACHE=1 also enables the parsed-prospect cache, so
+    # incremental re-runs skip fetch and parse for fresh entries.
+    prospect_cache = ProspectCache() if page_cache_enabled() else None
+
     with sync_playwright() as playwright:
         scraper = DraftBuzzScraper(
-            playwright=playwright, profile_root_dir=Path(output_directory)
+            playwright=playwright,
+            profile_root_dir=Path(output_directory),
+            cache=prospect_cache,
         )
 
         completed_profiles = []
@@ -363,14 +375,17 @@ def extract_draft_profiles(
                     continue
 
                 click.echo(f"Processing player profile: {prof_slug}")
-                time.sleep(uniform(3.5, 4.5))
 
                 try:
+                    # The pacing sleep lives in scrape_from_url, behind
+                    # its cache check, so cached prospects cost neither
+                    # the pause nor the photo re-download.
                     player_data = scraper.scrape_from_url(url=prof_slug, position=pos)
                     position_player_data[player_data.basic_info.full_name] = (
                         player_data.to_dict()
                     )
-                    scraper.save_player_photo_to_disk()
+                    if not scraper.last_prospect_cached:
+                        scraper.save_player_photo_to_disk()
 
                     completed_profiles.append(prof_slug)
 
@@ -385,6 +400,13 @@ def extract_draft_profiles(
 
             time.sleep(random.uniform(10, 15))
 
+        # Saving storage state lets the next run reuse the Cloudflare
+        # clearance cookie instead of re-solving the JS challenge.
+        scraper.close()
+
+    if prospect_cache is not None:
+        prospect_cache.close()
+
 
 @cli.command()
 @click.option(
@@ -425,15 +447,20 @@ def gen_prospect_word_docs(
 
         click.echo(f"Processing {len(position_data)} profiles.")
 
-        cur_count = 1
-        for prospect_name, data in position_data.items():
-            click.echo(f"Generating profile for {prospect_name}, #{cur_count} of {len(position_data)}")
+        # Per-prospect documents are independent CPU work, so they render
+        # across processes; only the cumulative document stays serial.
+        rendered = generate_documents_parallel(
+            position_data,
+            output_path=output_directory,
+            ring_image_base_dir=output_directory,
+            colors_path="input_files/school_colors.json",
+        )
+        for prospect_name in rendered:
+            click.echo(f"Generated profile for {prospect_name}")
 
+        for prospect_name, data in position_data.items():
             prospect = ProspectDataSoup.from_dict(data=data)
             wdg.add_prospect(prospect=prospect)
-
-            wdg.generate_complete_document()
-            cur_count += 1
     wdg.generate_complete_document(filename=f"2026_All_Prospects_COMPLETE.docx")
 
 
@@ -441,20 +468,13 @@ def gen_prospect_word_docs(
 @cli.command()
 @click.pass_context
 def update_draft_prospect_urls(ctx):
-    profile_lists = {}
     with sync_playwright() as playwright:
-        pple = ProspectProfileListExtractor(playwright=playwright)
-
-        for position in POSITIONS:
-            try:
-                profile_lists[position] = pple.extract_prospect_urls_for_position(
-                    pos=position
-                )
-            except TimeoutError:
-                print(
-                    f"Position {position} timed out. Sleeping, then moving on to next position."
-                )
-                time.sleep(5)
+        with ProspectProfileListExtractor(playwright=playwright) as pple:
+            # One async browser and one shared rate-limit semaphore cover
+            # every position, instead of a browser launch per position.
+            profile_lists = pple.extract_prospect_urls_for_positions(
+                list(POSITIONS)
+            )
 
     with open("prospect_urls.json", "w") as outfile:
         json.dump(profile_lists, outfile, indent=4)
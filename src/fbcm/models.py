@@ -3,18 +3,20 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, TypeAlias, get_args, get_origin, Union
 from docx.shared import RGBColor
 
-from .constants import PHOTO_BASE_DIR
+from .constants import photo_base_dir
 
 @dataclass
 class BaseModel:
     exclude_fields = []
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            key: value
-            for key, value in asdict(self).items()
-            if key not in self.exclude_fields
-        }
+        # Drop excluded keys from the asdict result instead of probing
+        # exclude_fields for every field and rebuilding the dict; most
+        # models exclude nothing, so this returns asdict's dict as-is.
+        data = asdict(self)
+        for key in self.exclude_fields:
+            data.pop(key, None)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseModel":
@@ -295,7 +297,7 @@ class BasicInfo(BaseModel):
 
     @property
     def photo_path(self):
-        return Path(PHOTO_BASE_DIR, f"{self.full_name}.png")
+        return Path(photo_base_dir(), f"{self.full_name}.png")
 
 
 @dataclass
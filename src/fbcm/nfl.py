@@ -17,8 +17,8 @@ from .base import (
 )
 from .constants import (
     CITY_TO_ABBR,
-    DEFAULT_REPLAY_TYPES,
-    MEDIA_BASE_DIR,
+    ReplayType,
+    media_base_dir,
     TEAM_FULL_NAMES,
 )
 
@@ -64,7 +64,7 @@ class NFLShowDownloader:
             cookie_file_path = Path(cookie_file_path)
         self.cookie_file_path = cookie_file_path
 
-        self.show_directory = Path(MEDIA_BASE_DIR, show_dir)
+        self.show_directory = Path(media_base_dir(), show_dir)
         self.show_directory.mkdir(parents=True, exist_ok=True)
 
         self.base_yt_ops = {
@@ -251,7 +251,7 @@ class NFLWeeklyDownloader(BaseDownloader, NFLBaseIE):
                 game_info["slug"] = ex_id.id
 
         if not replay_types:
-            replay_types = DEFAULT_REPLAY_TYPES.values()
+            replay_types = [member.display for member in ReplayType]
 
         game_info["replays"] = {}
         for replay in game.replays:
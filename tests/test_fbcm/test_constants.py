@@ -0,0 +1,50 @@
+from fbcm.constants import (
+    ABBREVIATION_MAP,
+    CITY_TO_ABBR,
+    POSITION_TO_GROUP_MAP,
+    TEAM_FULL_NAMES,
+    TEAMS,
+    position_group,
+)
+
+
+class TestTeamMaps:
+    def test_full_names_cover_every_named_alias_except_exclusions(self):
+        for team in TEAMS:
+            if team.full_name is None:
+                continue
+            for alias in team.aliases:
+                if alias == "LV":
+                    continue
+                assert TEAM_FULL_NAMES[alias] == team.full_name
+
+    def test_full_names_exclude_lv_alias(self):
+        assert "LV" not in TEAM_FULL_NAMES
+        assert TEAM_FULL_NAMES["LVR"] == "Las Vegas Raiders"
+
+    def test_full_names_omit_defunct_franchises(self):
+        for abbr in ("OAK", "SDG", "STL", "RAI", "PHO"):
+            assert abbr not in TEAM_FULL_NAMES
+
+    def test_aliases_share_city_with_canonical(self):
+        for team in TEAMS:
+            for alias in team.aliases:
+                assert ABBREVIATION_MAP[alias] == team.city
+
+    def test_city_maps_back_to_canonical_abbreviation(self):
+        for team in TEAMS:
+            assert CITY_TO_ABBR[team.city] == team.canonical
+
+
+class TestPositionGroup:
+    def test_position_group_matches_map_for_every_key(self):
+        for key, group in POSITION_TO_GROUP_MAP.items():
+            assert position_group(key) == group
+
+    def test_position_group_tolerates_feed_suffixes(self):
+        assert position_group("LOLB1") == "LB"
+        assert position_group("RCB-2") == "CB"
+
+    def test_position_group_unknown_returns_none(self):
+        assert position_group("XYZ") is None
+        assert position_group("") is None
@@ -0,0 +1,87 @@
+from bs4 import BeautifulSoup
+
+from fbcm.draft_buzz import PageFetcher, ProspectParserSoup
+
+
+def make_parser(html: str = "<html></html>", position: str = "QB") -> ProspectParserSoup:
+    return ProspectParserSoup(soup=BeautifulSoup(html, "lxml"), position=position)
+
+
+class TestParseComparisons:
+    COMPARISONS_HTML = """
+    <table>
+      <tbody>
+        <tr>
+          <td>Joe Player</td><td>QB</td><td>Ohio State</td><td>92%</td>
+        </tr>
+        <tr>
+          <td>Sam Other</td><td>QB</td><td>Texas A&amp;M</td><td>87%</td>
+        </tr>
+      </tbody>
+    </table>
+    """
+
+    def test_parse_comparisons_reads_each_cell(self):
+        parser = make_parser()
+        table = BeautifulSoup(self.COMPARISONS_HTML, "lxml").table
+
+        comparisons = parser.parse_comparisons(table=table)
+
+        assert len(comparisons) == 2
+        assert comparisons[0].name == "Joe Player"
+        assert comparisons[0].school == "Ohio State"
+        assert comparisons[0].similarity == 92
+
+    def test_parse_comparisons_keeps_multi_word_school(self):
+        parser = make_parser()
+        table = BeautifulSoup(self.COMPARISONS_HTML, "lxml").table
+
+        comparisons = parser.parse_comparisons(table=table)
+
+        assert comparisons[1].school == "Texas A&M"
+        assert comparisons[1].similarity == 87
+
+
+class TestExtractSkillRatings:
+    @staticmethod
+    def make_rows(*texts):
+        html = "".join(f"<tr><td>{text}</td></tr>" for text in texts)
+        return BeautifulSoup(f"<table>{html}</table>", "lxml").find_all("tr")
+
+    def test_extract_skill_ratings_basic_row(self):
+        parser = make_parser()
+        rows = self.make_rows("Release Speed: 85 / 100")
+
+        assert parser._extract_skill_ratings(rows=rows) == {"release_speed": 85}
+
+    def test_extract_skill_ratings_normalizes_name_punctuation(self):
+        parser = make_parser()
+        rows = self.make_rows("Short Acc. %: 78 / 100")
+
+        skills = parser._extract_skill_ratings(rows=rows)
+
+        assert skills == {"short_acc._": 78}
+
+    def test_extract_skill_ratings_decimal_rating(self):
+        # Targeted QB rating rows carry a decimal; it truncates to int.
+        parser = make_parser()
+        rows = self.make_rows("Deep Accuracy: 85.3 / 100")
+
+        assert parser._extract_skill_ratings(rows=rows) == {"deep_accuracy": 85}
+
+
+class TestSniffImageType:
+    def test_sniff_image_type_png(self):
+        assert PageFetcher._sniff_image_type(b"\x89PNG\r\n\x1a\n" + b"\x00" * 8) == "png"
+
+    def test_sniff_image_type_gif(self):
+        assert PageFetcher._sniff_image_type(b"GIF89a" + b"\x00" * 8) == "gif"
+
+    def test_sniff_image_type_webp(self):
+        assert PageFetcher._sniff_image_type(b"RIFF\x00\x00\x00\x00WEBP") == "webp"
+
+    def test_sniff_image_type_riff_but_not_webp(self):
+        assert PageFetcher._sniff_image_type(b"RIFF\x00\x00\x00\x00WAVE") == "jpeg"
+
+    def test_sniff_image_type_defaults_to_jpeg(self):
+        assert PageFetcher._sniff_image_type(b"\xff\xd8\xff\xe0" + b"\x00" * 8) == "jpeg"
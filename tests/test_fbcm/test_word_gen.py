@@ -0,0 +1,15 @@
+from fbcm.docx.word_gen import safe_filename
+
+
+class TestSafeFilename:
+    def test_safe_filename_spaces_become_underscores(self):
+        assert safe_filename("Joe Player") == "Joe_Player"
+
+    def test_safe_filename_strips_punctuation(self):
+        assert safe_filename("D'Andre Smith Jr.") == "DAndre_Smith_Jr"
+
+    def test_safe_filename_keeps_hyphens(self):
+        assert safe_filename("Jean-Luc Martin") == "Jean-Luc_Martin"
+
+    def test_safe_filename_plain_name_unchanged(self):
+        assert safe_filename("Plain_Name-1") == "Plain_Name-1"